@@ -1,3 +1,129 @@
-from django.test import TestCase
+import threading
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from . import warmup
+
+
+class ReadinessTests(TestCase):
+    def setUp(self):
+        warmup._warm.clear()
+
+    def test_not_ready_before_warmup(self):
+        response = self.client.get('/ready/')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['status'], 'warming')
+
+    def test_ready_after_warmup(self):
+        warmup._warm.set()
+        response = self.client.get('/ready/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'ready')
+
+
+class WarmupTests(TestCase):
+    def setUp(self):
+        warmup._warm.clear()
+
+    def test_warmup_off_by_default(self):
+        with self.settings():
+            del settings.CAPTCHA_WARMUP
+            self.assertFalse(warmup.warmup_enabled())
+
+    @override_settings(CAPTCHA_WARMUP=False)
+    def test_disabled_warmup_is_ready_immediately(self):
+        with mock.patch.object(warmup, 'run_warmup') as run_warmup:
+            warmup.start_warmup()
+        run_warmup.assert_not_called()
+        self.assertTrue(warmup.is_warm())
+
+    @mock.patch.object(warmup, 'warm_providers')
+    @mock.patch.object(warmup, 'warm_templates')
+    @mock.patch.object(warmup, 'check_animations', side_effect=RuntimeError("db down"))
+    def test_failing_step_is_not_ready(self, check_animations, warm_templates, warm_providers):
+        self.assertFalse(warmup.run_warmup())
+        self.assertFalse(warmup.is_warm())
+        warm_templates.assert_not_called()
+
+    @mock.patch.object(warmup, 'warm_providers')
+    @mock.patch.object(warmup, 'warm_templates')
+    @mock.patch.object(warmup, 'check_animations')
+    def test_essential_steps_succeed_is_ready(self, check_animations, warm_templates, warm_providers):
+        self.assertTrue(warmup.run_warmup())
+        self.assertTrue(warmup.is_warm())
+        warm_providers.assert_called_once()
+
+    def test_check_animations_raises_without_active_animations(self):
+        with self.assertRaises(RuntimeError):
+            warmup.check_animations()
+
+    @mock.patch.object(warmup, 'warm_providers')
+    @mock.patch.object(warmup, 'warm_templates')
+    def test_empty_catalog_is_not_ready(self, warm_templates, warm_providers):
+        self.assertFalse(warmup.run_warmup())
+        self.assertFalse(warmup.is_warm())
+
+    @mock.patch.object(warmup, 'connections')
+    @mock.patch.object(warmup.time, 'sleep')
+    @mock.patch.object(warmup, 'warm_providers')
+    @mock.patch.object(warmup, 'warm_templates')
+    @mock.patch.object(warmup, 'check_animations', side_effect=[RuntimeError("db down"), None])
+    def test_retries_until_ready(self, check_animations, warm_templates, warm_providers, sleep, connections):
+        warmup.warm_until_ready()
+        self.assertEqual(check_animations.call_count, 2)
+        sleep.assert_called_once_with(warmup.RETRY_INITIAL_DELAY)
+        self.assertTrue(warmup.is_warm())
+
+
+class ProviderSessionTests(TestCase):
+    def test_threads_share_one_connection_pool(self):
+        sessions = [warmup.get_provider_session()]
+        thread = threading.Thread(target=lambda: sessions.append(warmup.get_provider_session()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(sessions[0], sessions[1])
+        for session in sessions:
+            self.assertIs(session.get_adapter('https://api.groq.com/openai/v1'), warmup._adapter)
+
+    def test_warm_providers_uses_shared_pool(self):
+        def send(request, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.request = request
+            response.url = request.url
+            response._content = b''
+            return response
+
+        with mock.patch.object(warmup._adapter, 'send', side_effect=send) as send:
+            warmup.warm_providers()
+        self.assertEqual([call.args[0].url.rstrip('/') for call in send.call_args_list], warmup.PROVIDER_URLS)
+
+
+class AfterForkTests(TestCase):
+    def setUp(self):
+        self.saved = (warmup._adapter, warmup._local, warmup._warm, warmup._requested)
+
+    def tearDown(self):
+        warmup._adapter, warmup._local, warmup._warm, warmup._requested = self.saved
+
+    def test_requested_warmup_restarts_in_child(self):
+        warmup._requested = True
+        warmup._warm.set()
+        old_adapter, old_local = warmup._adapter, warmup._local
+        with mock.patch.object(warmup, 'start_warmup') as start_warmup:
+            warmup._after_fork()
+        start_warmup.assert_called_once_with()
+        self.assertFalse(warmup.is_warm())
+        self.assertIsNot(warmup._adapter, old_adapter)
+        self.assertIsNot(warmup._local, old_local)
+
+    def test_disabled_warmup_stays_ready_in_child(self):
+        warmup._requested = False
+        warmup._warm.set()
+        with mock.patch.object(warmup, 'start_warmup') as start_warmup:
+            warmup._after_fork()
+        start_warmup.assert_not_called()
+        self.assertTrue(warmup.is_warm())
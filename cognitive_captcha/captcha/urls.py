@@ -13,6 +13,7 @@ urlpatterns = [
     # path('api/verify-captcha/', views.verify_captcha),
     path('protected-page/', views.protected_page, name='protected-page'),
     path('get_captcha/', views.get_captcha, name='get_captcha'),
+    path('ready/', views.readiness, name='readiness'),
   
 ]
 
@@ -4,6 +4,7 @@ from django.views.decorators.csrf import csrf_protect, ensure_csrf_cookie
 from django.utils import timezone
 from django.shortcuts import render, redirect
 from .models import CaptchaAttempt, Animation
+from .warmup import get_provider_session, is_warm
 import json
 import random
 import os
@@ -49,6 +50,13 @@ def protected_page(request):
 def first_page(request):
     return render(request, 'first_page.html')
 
+@require_http_methods(["GET"])
+def readiness(request):
+    """Load balancer readiness probe: 200 once the worker has warmed up"""
+    if is_warm():
+        return JsonResponse({'status': 'ready'})
+    return JsonResponse({'status': 'warming'}, status=503)
+
 @csrf_protect
 @require_http_methods(["GET"])
 def get_captcha(request):
@@ -149,7 +157,7 @@ def generate_ai_question(description):
     """
     
     try:
-        response = requests.post(
+        response = get_provider_session().post(
             'https://api.groq.com/openai/v1/chat/completions',
             headers={'Authorization': f'Bearer {settings.GROQ_API_KEY}'},
             json={
@@ -220,7 +228,7 @@ def generate_emergency_fallback(description):
     try:
         print("🔧 Attempting OpenAI API call...")  
         # Try OpenAI API as backup
-        response = requests.post(
+        response = get_provider_session().post(
             'https://api.openai.com/v1/chat/completions',
             headers={'Authorization': f'Bearer {settings.OPENAI_API_KEY}'},
             json={
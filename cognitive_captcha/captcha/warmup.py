@@ -0,0 +1,153 @@
+"""
+Worker warm-up and readiness for the captcha app.
+
+Enable it in settings with::
+
+    CAPTCHA_WARMUP = True
+
+It is off by default. While it is off, ``/ready/`` reports ready immediately,
+so the probe only keeps cold workers out of rotation once this is turned on.
+"""
+import os
+import threading
+import time
+
+import requests
+from django.conf import settings
+from django.db import connections
+from django.template.loader import get_template
+from requests.adapters import HTTPAdapter
+
+PROVIDER_URLS = [
+    'https://api.groq.com',
+    'https://api.openai.com',
+]
+
+WARM_TEMPLATES = [
+    'captcha_page.html',
+    'first_page.html',
+    'protected_page.html',
+]
+
+PROVIDER_WARM_TIMEOUT = 2
+RETRY_INITIAL_DELAY = 1
+RETRY_MAX_DELAY = 30
+
+# One connection pool per worker, shared by every thread (urllib3 pools are
+# thread-safe). requests.Session itself isn't guaranteed thread-safe, so each
+# thread gets its own session mounted on this adapter.
+def _new_adapter():
+    return HTTPAdapter(pool_connections=len(PROVIDER_URLS), pool_maxsize=10)
+
+
+_adapter = _new_adapter()
+_local = threading.local()
+_warm = threading.Event()
+_requested = False
+
+
+def get_provider_session():
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = requests.Session()
+        session.mount('https://', _adapter)
+    return session
+
+
+def is_warm():
+    return _warm.is_set()
+
+
+def warmup_enabled():
+    return getattr(settings, 'CAPTCHA_WARMUP', False)
+
+
+def check_animations():
+    """Run the catalog query the challenge view uses; no active animation means no challenge"""
+    from .models import Animation
+    if Animation.objects.filter(is_active=True).order_by('?').first() is None:
+        raise RuntimeError("no active animations")
+    print("🔥 Database reachable, active animations found")
+
+
+def warm_templates():
+    for name in WARM_TEMPLATES:
+        get_template(name).render({})
+    print("🔥 Templates compiled")
+
+
+def warm_providers():
+    """Best-effort: open a keep-alive connection to each provider in the shared pool"""
+    session = get_provider_session()
+    for url in PROVIDER_URLS:
+        try:
+            session.head(url, timeout=PROVIDER_WARM_TIMEOUT)
+            print(f"🔥 Connection opened to {url}")
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Warm-up connection to {url} failed: {e}")
+
+
+def run_warmup():
+    """Warm up this worker and mark it ready only if the essential steps succeed"""
+    try:
+        check_animations()
+        warm_templates()
+    except Exception as e:
+        print(f"❌ Warm-up failed, worker stays not ready: {e}")
+        return False
+
+    # Provider failures are tolerated: challenges still fall back to offline questions
+    warm_providers()
+
+    _warm.set()
+    print("✅ Worker is warm")
+    return True
+
+
+def warm_until_ready():
+    """Retry the warm-up with backoff, so a DB hiccup or empty catalog isn't permanent"""
+    delay = RETRY_INITIAL_DELAY
+    while not run_warmup():
+        # Drop possibly broken DB connections before the next attempt
+        connections.close_all()
+        time.sleep(delay)
+        delay = min(delay * 2, RETRY_MAX_DELAY)
+
+
+def _warmup_thread():
+    try:
+        warm_until_ready()
+    finally:
+        connections.close_all()
+
+
+def start_warmup():
+    """
+    Called from the serving entry point (wsgi.py / asgi.py), once per worker process.
+
+    Does nothing but mark the worker ready unless CAPTCHA_WARMUP = True.
+    """
+    global _requested
+    if not warmup_enabled():
+        _warm.set()
+        return
+    _requested = True
+    threading.Thread(target=_warmup_thread, name='captcha-warmup', daemon=True).start()
+
+
+def _after_fork():
+    # Forking servers that preload the app (gunicorn --preload, uWSGI without
+    # lazy-apps): don't inherit the master's sockets or readiness, warm up again.
+    global _adapter, _local, _warm
+    _adapter = _new_adapter()
+    _local = threading.local()
+    was_warm = _warm.is_set()
+    _warm = threading.Event()
+    if _requested:
+        start_warmup()
+    elif was_warm:
+        _warm.set()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cognitive_captcha.settings')
 
 application = get_wsgi_application()
+
+# Warm up only in serving processes, not in manage.py commands
+from captcha.warmup import start_warmup  # noqa: E402
+start_warmup()